@@ -1,13 +1,8 @@
 # app.py
 
 import os
-import joblib
-import yfinance as yf
-import pandas as pd
 import numpy as np
 from flask import Flask, request, jsonify, render_template
-from ta import add_all_ta_features
-from ta.utils import dropna
 
 app = Flask(__name__)
 
@@ -22,7 +17,15 @@ TICKERS = [
 
 # Helper to fetch live data and preprocess
 def get_latest_features(ticker):
-    data = yf.download(ticker, period="2d", interval="1m", auto_adjust=True)
+    # Heavy data/indicator stacks are only needed for predictions, not to serve "/"
+    import yfinance as yf
+    from ta import add_all_ta_features
+    from ta.utils import dropna
+
+    data = yf.download(
+        ticker, period="2d", interval="1m", auto_adjust=True,
+        progress=False, threads=False
+    )
     if data.empty or len(data) < 20:
         raise ValueError(f"Not enough data for {ticker}")
 
@@ -31,8 +34,9 @@ def get_latest_features(ticker):
         data, open="Open", high="High", low="Low", close="Close", volume="Volume"
     )
     data["Return"] = data["Close"].pct_change()
-    data["LogReturn"] = (1 + data["Return"]).apply(
-        lambda x: pd.NA if pd.isna(x) or x <= 0 else np.log(x)
+    returns = data["Return"].to_numpy(dtype=np.float64)
+    data["LogReturn"] = np.log1p(
+        returns, out=np.full_like(returns, np.nan), where=returns > -1
     )
     data["MA7"] = data["Close"].rolling(window=7).mean()
     data["VolumeChange"] = data["Volume"].pct_change()
@@ -53,6 +57,8 @@ def predict():
         return jsonify({"error": "Invalid ticker"}), 400
 
     try:
+        import joblib
+
         features = get_latest_features(ticker)
         model_path = os.path.join(MODEL_DIR, f"{ticker.replace('.', '_')}_model.pkl")
         model = joblib.load(model_path)
@@ -1,13 +1,15 @@
 # scripts/build_minute_dataset.py
 
 import os
+
+# Keep Numba's compiled kernels next to the project so later runs skip the JIT
+os.environ.setdefault(
+    "NUMBA_CACHE_DIR", os.path.join(os.path.dirname(__file__), "..", ".numba_cache")
+)
+
 import yfinance as yf
-import pandas as pd
 import numpy as np
-from ta.trend import SMAIndicator, EMAIndicator, MACD
-from ta.momentum import RSIIndicator, StochasticOscillator
-from ta.volatility import BollingerBands
-from ta.volume import VolumeWeightedAveragePrice
+from numba import njit
 from ta.utils import dropna
 
 # Output directory for minute-level data
@@ -22,52 +24,139 @@ indian_tickers = [
     "NESTLEIND.NS", "TECHM.NS", "KOTAKBANK.NS", "SUNPHARMA.NS", "HCLTECH.NS"
 ]
 
+# Indicator columns produced by compute_indicators, in output order
+INDICATOR_COLUMNS = [
+    'SMA_20', 'EMA_20', 'MACD', 'MACD_Signal', 'MACD_Histogram', 'RSI',
+    'BB_Upper', 'BB_Middle', 'BB_Lower', 'Stoch_K', 'Stoch_D', 'VWAP'
+]
+
+@njit(cache=True, error_model='numpy')
+def compute_indicators(close, high, low, volume):
+    """Compute every indicator column in a single pass over the price arrays.
+
+    Matches the `ta` defaults: SMA/EMA/Bollinger(20, 2), MACD(12, 26, 9),
+    RSI(14), Stochastic(14, 3) and VWAP(14), NaN until each window is full.
+    """
+    n = close.shape[0]
+    out = np.full((n, 12), np.nan)
+
+    a20 = 2.0 / 21.0
+    a12 = 2.0 / 13.0
+    a26 = 2.0 / 27.0
+    a9 = 2.0 / 10.0
+    a14 = 1.0 / 14.0
+
+    ema20 = 0.0
+    ema12 = 0.0
+    ema26 = 0.0
+    signal = 0.0
+    avg_up = 0.0
+    avg_down = 0.0
+
+    for i in range(n):
+        c = close[i]
+
+        # Exponential recurrences (pandas ewm, adjust=False)
+        if i == 0:
+            ema20 = c
+            ema12 = c
+            ema26 = c
+        else:
+            ema20 = (1.0 - a20) * ema20 + a20 * c
+            ema12 = (1.0 - a12) * ema12 + a12 * c
+            ema26 = (1.0 - a26) * ema26 + a26 * c
+            diff = c - close[i - 1]
+            up = diff if diff > 0 else 0.0
+            down = -diff if diff < 0 else 0.0
+            avg_up = (1.0 - a14) * avg_up + a14 * up
+            avg_down = (1.0 - a14) * avg_down + a14 * down
+
+        if i >= 19:
+            out[i, 1] = ema20
+
+        # MACD and its signal line, which starts at the first full MACD value
+        if i >= 25:
+            macd = ema12 - ema26
+            if i == 25:
+                signal = macd
+            else:
+                signal = (1.0 - a9) * signal + a9 * macd
+            out[i, 2] = macd
+            if i >= 33:
+                out[i, 3] = signal
+                out[i, 4] = macd - signal
+
+        # RSI
+        if i >= 13:
+            if avg_down == 0:
+                out[i, 5] = 100.0
+            else:
+                out[i, 5] = 100.0 - 100.0 / (1.0 + avg_up / avg_down)
+
+        # SMA and Bollinger Bands (population std)
+        if i >= 19:
+            total = 0.0
+            for j in range(i - 19, i + 1):
+                total += close[j]
+            mean = total / 20.0
+            sq = 0.0
+            for j in range(i - 19, i + 1):
+                sq += (close[j] - mean) ** 2
+            std = np.sqrt(sq / 20.0)
+            out[i, 0] = mean
+            out[i, 6] = mean + 2.0 * std
+            out[i, 7] = mean
+            out[i, 8] = mean - 2.0 * std
+
+        # Stochastic oscillator and VWAP over the trailing 14 bars
+        if i >= 13:
+            lo = low[i]
+            hi = high[i]
+            pv = 0.0
+            vol = 0.0
+            for j in range(i - 13, i + 1):
+                if low[j] < lo:
+                    lo = low[j]
+                if high[j] > hi:
+                    hi = high[j]
+                pv += (high[j] + low[j] + close[j]) / 3.0 * volume[j]
+                vol += volume[j]
+            out[i, 9] = 100.0 * (c - lo) / (hi - lo)
+            out[i, 11] = pv / vol
+            if i >= 15:
+                out[i, 10] = (out[i - 2, 9] + out[i - 1, 9] + out[i, 9]) / 3.0
+
+    return out
+
+# Compile (or load from cache) up front so the first ticker doesn't pay for it
+_warmup = np.zeros(32)
+compute_indicators(_warmup, _warmup, _warmup, _warmup)
+
 def add_technical_indicators(df):
     """Add technical indicators to the dataframe"""
     try:
-        # Moving averages
-        df['SMA_20'] = SMAIndicator(close=df['Close'], window=20).sma_indicator()
-        df['EMA_20'] = EMAIndicator(close=df['Close'], window=20).ema_indicator()
-        
-        # MACD
-        macd = MACD(close=df['Close'])
-        df['MACD'] = macd.macd()
-        df['MACD_Signal'] = macd.macd_signal()
-        df['MACD_Histogram'] = macd.macd_diff()
-        
-        # RSI
-        df['RSI'] = RSIIndicator(close=df['Close']).rsi()
-        
-        # Bollinger Bands
-        bb = BollingerBands(close=df['Close'])
-        df['BB_Upper'] = bb.bollinger_hband()
-        df['BB_Middle'] = bb.bollinger_mavg()
-        df['BB_Lower'] = bb.bollinger_lband()
-        
-        # Stochastic Oscillator
-        stoch = StochasticOscillator(high=df['High'], low=df['Low'], close=df['Close'])
-        df['Stoch_K'] = stoch.stoch()
-        df['Stoch_D'] = stoch.stoch_signal()
-        
-        # Volume indicators
-        df['VWAP'] = VolumeWeightedAveragePrice(high=df['High'], low=df['Low'], close=df['Close'], volume=df['Volume']).volume_weighted_average_price()
-        
+        df[INDICATOR_COLUMNS] = compute_indicators(
+            df['Close'].to_numpy(dtype=np.float64),
+            df['High'].to_numpy(dtype=np.float64),
+            df['Low'].to_numpy(dtype=np.float64),
+            df['Volume'].to_numpy(dtype=np.float64),
+        )
     except Exception as e:
         print(f"Error adding technical indicators: {e}")
     
     return df
 
-def fetch_minute_data(ticker):
+def process_minute_data(ticker, bulk):
     try:
-        print(f"Fetching minute-level data for {ticker}...")
-        data = yf.download(ticker, period="7d", interval="1m", auto_adjust=True)
-        
-        # Handle None return from yf.download
-        if data is None or data.empty:
+        # Tickers that failed in the batch download come back empty or all-NaN,
+        # or are missing entirely if the whole download failed
+        if ticker not in bulk.columns.get_level_values(0):
+            print(f"No data for {ticker}, skipping.")
+            return
+        data = dropna(bulk[ticker])
+        if data.empty:
             print(f"No data for {ticker}, skipping.")
             return
-
-        data = dropna(data)
         
         # Ensure we have the required columns
         required_columns = ["Open", "High", "Low", "Close", "Volume"]
@@ -80,8 +169,9 @@ def fetch_minute_data(ticker):
 
         # Add extra features
         data["Return"] = data["Close"].pct_change()
-        data["LogReturn"] = (1 + data["Return"]).apply(
-            lambda x: pd.NA if pd.isna(x) or x <= 0 else np.log(x)
+        returns = data["Return"].to_numpy(dtype=np.float64)
+        data["LogReturn"] = np.log1p(
+            returns, out=np.full_like(returns, np.nan), where=returns > -1
         )
         data["MA7"] = data["Close"].rolling(window=7).mean()
         data["VolumeChange"] = data["Volume"].pct_change()
@@ -90,8 +180,15 @@ def fetch_minute_data(ticker):
         data.to_csv(filename)
         print(f"Saved {filename}")
     except Exception as e:
-        print(f"Error fetching {ticker}: {e}")
+        print(f"Error processing {ticker}: {e}")
+
+# Fetch every ticker in one batched call; yfinance downloads them concurrently
+print(f"Fetching minute-level data for {len(indian_tickers)} tickers...")
+bulk = yf.download(
+    indian_tickers, period="7d", interval="1m", auto_adjust=True,
+    group_by="ticker", threads=True
+)
 
 # Run for all tickers
 for ticker in indian_tickers:
-    fetch_minute_data(ticker)
+    process_minute_data(ticker, bulk)
@@ -0,0 +1,21 @@
+# scripts/convert_lstm_tflite.py
+
+import os
+import tensorflow as tf
+from tensorflow.keras.models import load_model
+
+# Model directory shared with the training and real-time scripts
+model_dir = os.path.join(os.path.dirname(__file__), "..", "models")
+keras_path = os.path.join(model_dir, "lstm_model.h5")
+tflite_path = os.path.join(model_dir, "lstm_model.tflite")
+
+# Convert the trained Keras LSTM once, with dynamic-range INT8 weight quantization,
+# for the real-time predictor to run through the TFLite interpreter
+model = load_model(keras_path)
+converter = tf.lite.TFLiteConverter.from_keras_model(model)
+converter.optimizations = [tf.lite.Optimize.DEFAULT]
+tflite_model = converter.convert()
+
+with open(tflite_path, "wb") as f:
+    f.write(tflite_model)
+print(f"Saved {tflite_path} ({len(tflite_model) / 1024:.1f} KiB)")
@@ -1,5 +1,6 @@
 # scripts/realtime_predictor.py
 
+import os
 import time
 import yfinance as yf
 import numpy as np
@@ -8,15 +9,34 @@ import joblib
 from ta import add_all_ta_features
 from ta.utils import dropna
 from xgboost import XGBRegressor
-from tensorflow.keras.models import load_model
+import tensorflow as tf
 from sklearn.preprocessing import StandardScaler
 
-# Load XGBoost model
+# Load XGBoost model and predict through its booster, skipping DMatrix construction
 xgb_model = joblib.load("../models/xgb_model.joblib")
-# Load LSTM model
-lstm_model = load_model("../models/lstm_model.h5")
-# Load scaler (used during training)
+xgb_booster = xgb_model.get_booster()
+xgb_booster.set_param({"nthread": 1})
+# Load the LSTM, preferring the quantized TFLite export from convert_lstm_tflite.py
+lstm_tflite_path = "../models/lstm_model.tflite"
+if os.path.exists(lstm_tflite_path):
+    lstm_model = None
+    lstm_interpreter = tf.lite.Interpreter(model_path=lstm_tflite_path)
+    lstm_interpreter.allocate_tensors()
+    lstm_input_index = lstm_interpreter.get_input_details()[0]["index"]
+    lstm_output_index = lstm_interpreter.get_output_details()[0]["index"]
+else:
+    print(f"{lstm_tflite_path} not found - run convert_lstm_tflite.py for faster "
+          "inference. Falling back to the Keras model.")
+    lstm_interpreter = None
+    lstm_model = tf.keras.models.load_model("../models/lstm_model.h5")
+# Load scaler (used during training) and keep its statistics so each tick can
+# standardize with plain NumPy instead of going through transform()'s validation
 scaler = joblib.load("../models/scaler.joblib")
+scaler_mean = scaler.mean_ if scaler.with_mean else 0.0
+scaler_inv_scale = 1.0 / scaler.scale_ if scaler.with_std else 1.0
+# Training column order, when the scaler was fitted on a DataFrame; selecting it
+# each tick keeps the name check transform() used to do (missing columns raise)
+scaler_features = getattr(scaler, "feature_names_in_", None)
 
 # Ticker to monitor
 ticker = "RELIANCE.NS"
@@ -30,7 +50,7 @@ print(f"Starting real-time monitoring for {ticker}...")
 while True:
     try:
         # Fetch latest minute-level data (last 1 day for feature history)
-        data = yf.download(ticker, period="1d", interval=interval)
+        data = yf.download(ticker, period="1d", interval=interval, progress=False, threads=False)
         data = dropna(data)
 
         # Feature engineering
@@ -38,8 +58,9 @@ while True:
             data, open="Open", high="High", low="Low", close="Close", volume="Volume"
         )
         data["Return"] = data["Close"].pct_change()
-        data["LogReturn"] = (1 + data["Return"]).apply(
-            lambda x: pd.NA if pd.isna(x) or x <= 0 else np.log(x)
+        returns = data["Return"].to_numpy(dtype=np.float64)
+        data["LogReturn"] = np.log1p(
+            returns, out=np.full_like(returns, np.nan), where=returns > -1
         )
         data["MA7"] = data["Close"].rolling(window=7).mean()
         data["VolumeChange"] = data["Volume"].pct_change()
@@ -47,19 +68,24 @@ while True:
         # Drop rows with missing values
         data.dropna(inplace=True)
 
-        # Extract the most recent row
-        latest_features = data.iloc[-1:]
+        # Scale the trailing window once; both models read from it
+        if scaler_features is not None:
+            data = data[scaler_features]
+        window = data.iloc[-window_size:].to_numpy(dtype=np.float64)
+        input_scaled = ((window - scaler_mean) * scaler_inv_scale).astype(np.float32)
 
-        # Scale input for both models
-        input_scaled = scaler.transform(latest_features)
+        # --- XGBoost prediction (latest row) ---
+        xgb_pred = xgb_booster.inplace_predict(np.ascontiguousarray(input_scaled[-1:]))[0]
 
-        # --- XGBoost prediction ---
-        xgb_pred = xgb_model.predict(input_scaled)[0]
-
-        # --- LSTM prediction ---
+        # --- LSTM prediction (full window) ---
         if len(data) >= window_size:
-            lstm_input = input_scaled[-window_size:].reshape(1, window_size, -1)
-            lstm_pred = lstm_model.predict(lstm_input)[0][0]
+            lstm_input = input_scaled.reshape(1, window_size, -1)
+            if lstm_interpreter is not None:
+                lstm_interpreter.set_tensor(lstm_input_index, lstm_input)
+                lstm_interpreter.invoke()
+                lstm_pred = float(lstm_interpreter.get_tensor(lstm_output_index)[0][0])
+            else:
+                lstm_pred = float(lstm_model(lstm_input, training=False)[0][0])
         else:
             lstm_pred = None
 